@@ -1,15 +1,28 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+import itertools
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from campus_job_board import JobBoard, UserRole, JobType, ApplicationStatus
+from campus_job_board import (JobBoard, UserRole, JobType, ApplicationStatus, DeadlineScheduler,
+                              normalize_deadline, stream_csv, stream_ndjson, iter_import_rows,
+                              ImportFormatError, decode_lines)
 import datetime
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
 job_board = JobBoard()
+deadline_scheduler = None
+
+def start_scheduler():
+    """Start closing expired jobs and archiving closed ones in the background"""
+    global deadline_scheduler
+    if deadline_scheduler is None:
+        interval = int(os.environ.get('JOB_SCHEDULER_INTERVAL', 3600))
+        deadline_scheduler = DeadlineScheduler(job_board, interval=interval)
+    deadline_scheduler.start()
+    return deadline_scheduler
 
 # Session management (simple in-memory for demo, use JWT in production)
 sessions = {}
@@ -24,6 +37,49 @@ def get_current_user():
                 return user
     return None
 
+def include_archived():
+    """Check whether the request asks for archived records too"""
+    return request.args.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+# Columns for CSV exports
+JOB_EXPORT_FIELDS = ['id', 'company_id', 'company_name', 'title', 'type', 'location',
+                     'deadline', 'status', 'created_at', 'description', 'requirements']
+APPLICATION_EXPORT_FIELDS = ['id', 'job_id', 'job_title', 'company_name', 'student_id',
+                             'student_name', 'status', 'applied_at', 'cover_letter']
+
+def get_data_format():
+    """Get the requested data format (csv or ndjson) from the query string, upload or content type.
+    
+    Returns None when the format is invalid or can't be determined from an upload.
+    """
+    fmt = request.args.get('format')
+    if fmt is None and 'file' in request.files:
+        upload = request.files['file']
+        filename = (upload.filename or '').lower()
+        mimetype = (upload.mimetype or '').lower()
+        if filename.endswith('.csv') or 'csv' in mimetype:
+            fmt = 'csv'
+        elif filename.endswith(('.ndjson', '.jsonl')) or 'ndjson' in mimetype or 'jsonl' in mimetype:
+            fmt = 'ndjson'
+    elif fmt is None:
+        fmt = 'csv' if 'csv' in (request.content_type or '') else 'ndjson'
+    return fmt if fmt in ('csv', 'ndjson') else None
+
+def export_response(rows, fields, name, fmt):
+    """Stream rows as a CSV or NDJSON attachment"""
+    if fmt == 'csv':
+        body, mimetype = stream_csv(rows, fields), 'text/csv'
+    else:
+        body, mimetype = stream_ndjson(rows), 'application/x-ndjson'
+    return Response(body, mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename={name}.{fmt}'
+    })
+
+def get_import_rows(fmt):
+    """Read import rows from an uploaded file or the raw request body"""
+    source = request.files['file'].stream if 'file' in request.files else request.stream
+    return iter_import_rows(decode_lines(source), fmt)
+
 # Authentication endpoints
 @app.route('/api/register', methods=['POST'])
 def register():
@@ -180,8 +236,9 @@ def debug_users():
 # Job endpoints
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    """Get all approved jobs"""
-    approved_jobs = [job for job in job_board.jobs if job['status'] == 'approved']
+    """Get all approved jobs whose deadline hasn't passed"""
+    today = datetime.date.today()
+    approved_jobs = [job for job in job_board.jobs if job_board.is_job_open(job, today)]
     return jsonify(approved_jobs), 200
 
 @app.route('/api/jobs', methods=['POST'])
@@ -196,6 +253,12 @@ def create_job():
     
     data = request.json
     
+    deadline = None
+    if data.get('deadline'):
+        deadline = normalize_deadline(data['deadline'], not_before=datetime.date.today())
+        if deadline is None:
+            return jsonify({'error': 'Invalid or ambiguous deadline, expected YYYY-MM-DD'}), 400
+    
     job_data = {
         'id': job_board.get_next_job_id(),
         'company_id': user['id'],
@@ -205,7 +268,7 @@ def create_job():
         'description': data.get('description'),
         'requirements': data.get('requirements'),
         'location': data.get('location'),
-        'deadline': data.get('deadline'),
+        'deadline': deadline,
         'status': 'pending',
         'created_at': datetime.datetime.now().isoformat()
     }
@@ -216,14 +279,37 @@ def create_job():
 
 @app.route('/api/jobs/my', methods=['GET'])
 def get_my_jobs():
-    """Get company's own jobs"""
+    """Get company's own jobs, including archived ones with ?include_archived=1"""
     user = get_current_user()
     if not user or user['role'] != UserRole.COMPANY.value:
         return jsonify({'error': 'Access denied'}), 403
     
     my_jobs = [job for job in job_board.jobs if job['company_id'] == user['id']]
+    if include_archived():
+        my_jobs += job_board.get_archived_jobs(company_id=user['id'])
     return jsonify(my_jobs), 200
 
+@app.route('/api/jobs/export', methods=['GET'])
+def export_jobs():
+    """Stream jobs as CSV or NDJSON (company's own jobs, or all jobs for admins).
+    
+    Archived jobs are included with ?include_archived=1.
+    """
+    user = get_current_user()
+    if not user or user['role'] not in (UserRole.COMPANY.value, UserRole.ADMIN.value):
+        return jsonify({'error': 'Access denied'}), 403
+    
+    fmt = get_data_format()
+    if fmt is None:
+        return jsonify({'error': 'Unknown format, pass ?format=csv or ?format=ndjson'}), 400
+    
+    jobs = job_board.jobs
+    company_id = user['id'] if user['role'] == UserRole.COMPANY.value else None
+    rows = (job for job in jobs if company_id is None or job['company_id'] == company_id)
+    if include_archived():
+        rows = itertools.chain(rows, job_board.iter_archived_jobs(company_id=company_id))
+    return export_response(rows, JOB_EXPORT_FIELDS, 'jobs', fmt)
+
 @app.route('/api/jobs/<int:job_id>', methods=['GET'])
 def get_job(job_id):
     """Get a specific job"""
@@ -245,8 +331,8 @@ def create_application():
     
     # Find job
     job = next((j for j in job_board.jobs if j['id'] == job_id), None)
-    if not job or job['status'] != 'approved':
-        return jsonify({'error': 'Job not found or not approved'}), 404
+    if not job or not job_board.is_job_open(job):
+        return jsonify({'error': 'Job not found, not approved or past its deadline'}), 404
     
     # Check if already applied
     existing = next(
@@ -267,13 +353,15 @@ def create_application():
         'applied_at': datetime.datetime.now().isoformat()
     }
     
-    job_board.add_application(application)
+    # The job may have been closed or archived since it was looked up
+    if not job_board.add_application(application):
+        return jsonify({'error': 'Job not found, not approved or past its deadline'}), 404
     
     return jsonify({'message': 'Application submitted successfully', 'application': application}), 201
 
 @app.route('/api/applications/my', methods=['GET'])
 def get_my_applications():
-    """Get student's own applications"""
+    """Get student's own applications, including archived ones with ?include_archived=1"""
     user = get_current_user()
     if not user:
         return jsonify({'error': 'Not authenticated'}), 401
@@ -285,6 +373,8 @@ def get_my_applications():
         for app in my_applications:
             job = next((j for j in job_board.jobs if j['id'] == app['job_id']), None)
             app['job'] = job
+        if include_archived():
+            my_applications += job_board.get_archived_applications(student_id=user['id'])
         return jsonify(my_applications), 200
     elif user['role'] == UserRole.COMPANY.value:
         # Get applications for company's jobs
@@ -294,10 +384,44 @@ def get_my_applications():
         for app in job_applications:
             job = next((j for j in job_board.jobs if j['id'] == app['job_id']), None)
             app['job'] = job
+        if include_archived():
+            job_applications += job_board.get_archived_applications(company_id=user['id'])
         return jsonify(job_applications), 200
     else:
         return jsonify({'error': 'Invalid role'}), 403
 
+@app.route('/api/applications/export', methods=['GET'])
+def export_applications():
+    """Stream applications as CSV or NDJSON, optionally for a single job.
+    
+    Applications to archived jobs are included with ?include_archived=1.
+    """
+    user = get_current_user()
+    if not user:
+        return jsonify({'error': 'Not authenticated'}), 401
+    
+    fmt = get_data_format()
+    if fmt is None:
+        return jsonify({'error': 'Unknown format, pass ?format=csv or ?format=ndjson'}), 400
+    
+    filters = {'job_id': request.args.get('job_id', type=int)}
+    if user['role'] == UserRole.STUDENT.value:
+        filters['student_id'] = user['id']
+    elif user['role'] == UserRole.COMPANY.value:
+        filters['company_id'] = user['id']
+    applications = job_board.iter_applications(**filters)
+    if include_archived():
+        applications = itertools.chain(applications, job_board.iter_archived_applications(**filters))
+    
+    if fmt == 'csv':
+        rows = (dict(app,
+                     job_title=(app['job'] or {}).get('title'),
+                     company_name=(app['job'] or {}).get('company_name'))
+                for app in applications)
+    else:
+        rows = applications
+    return export_response(rows, APPLICATION_EXPORT_FIELDS, 'applications', fmt)
+
 @app.route('/api/applications/<int:app_id>/status', methods=['PUT'])
 def update_application_status(app_id):
     """Update application status (company users only)"""
@@ -316,7 +440,9 @@ def update_application_status(app_id):
     if not job or job['company_id'] != user['id']:
         return jsonify({'error': 'Access denied'}), 403
     
-    job_board.update_application(app_id, {'status': status})
+    # The application may have been archived since it was looked up
+    if not job_board.update_application(app_id, {'status': status}):
+        return jsonify({'error': 'Application not found'}), 404
     
     return jsonify({'message': 'Application status updated', 'application': application}), 200
 
@@ -373,13 +499,15 @@ def approve_job(job_id):
     
     data = request.json
     if data.get('action') == 'approve':
-        job['status'] = 'approved'
+        status = 'approved'
     elif data.get('action') == 'reject':
-        job['status'] = 'rejected'
+        status = 'rejected'
     else:
         return jsonify({'error': 'Invalid action'}), 400
     
-    job_board.update_job(job_id, {'status': job['status']})
+    # The job may have been archived since it was looked up
+    if not job_board.update_job(job_id, {'status': status}):
+        return jsonify({'error': 'Job not found'}), 404
     return jsonify({'message': 'Job status updated', 'job': job}), 200
 
 @app.route('/api/admin/applications', methods=['GET'])
@@ -396,8 +524,79 @@ def get_all_applications():
         app['job'] = job
     return jsonify(apps), 200
 
+@app.route('/api/admin/import/jobs', methods=['POST'])
+def import_jobs():
+    """Bulk import jobs from an NDJSON or CSV upload (admin only)"""
+    user = get_current_user()
+    if not user or user['role'] != UserRole.ADMIN.value:
+        return jsonify({'error': 'Access denied'}), 403
+    
+    fmt = get_data_format()
+    if fmt is None:
+        return jsonify({'error': 'Unknown format, pass ?format=csv or ?format=ndjson'}), 400
+    
+    try:
+        imported, rejected, errors = job_board.bulk_import_jobs(get_import_rows(fmt))
+    except ImportFormatError as e:
+        return jsonify({'error': str(e), 'line': e.line_number}), 400
+    return jsonify({'imported': imported, 'rejected': rejected, 'errors': errors}), 200
+
+@app.route('/api/admin/import/users', methods=['POST'])
+def import_users():
+    """Bulk import users from an NDJSON or CSV upload (admin only)"""
+    user = get_current_user()
+    if not user or user['role'] != UserRole.ADMIN.value:
+        return jsonify({'error': 'Access denied'}), 403
+    
+    fmt = get_data_format()
+    if fmt is None:
+        return jsonify({'error': 'Unknown format, pass ?format=csv or ?format=ndjson'}), 400
+    
+    try:
+        imported, rejected, errors = job_board.bulk_import_users(get_import_rows(fmt))
+    except ImportFormatError as e:
+        return jsonify({'error': str(e), 'line': e.line_number}), 400
+    return jsonify({'imported': imported, 'rejected': rejected, 'errors': errors}), 200
+
+@app.route('/api/admin/archive', methods=['GET'])
+def get_archive_partitions():
+    """List archived semester partitions (admin only)"""
+    user = get_current_user()
+    if not user or user['role'] != UserRole.ADMIN.value:
+        return jsonify({'error': 'Access denied'}), 403
+    
+    return jsonify(job_board.get_archive_partitions()), 200
+
+@app.route('/api/admin/archive/jobs', methods=['GET'])
+def get_archived_jobs():
+    """Get archived jobs, optionally filtered by partition and company (admin only)"""
+    user = get_current_user()
+    if not user or user['role'] != UserRole.ADMIN.value:
+        return jsonify({'error': 'Access denied'}), 403
+    
+    jobs = job_board.get_archived_jobs(
+        partition=request.args.get('partition'),
+        company_id=request.args.get('company_id', type=int)
+    )
+    return jsonify(jobs), 200
+
+@app.route('/api/admin/archive/applications', methods=['GET'])
+def get_archived_applications():
+    """Get archived applications, optionally filtered by partition, job and student (admin only)"""
+    user = get_current_user()
+    if not user or user['role'] != UserRole.ADMIN.value:
+        return jsonify({'error': 'Access denied'}), 403
+    
+    applications = job_board.get_archived_applications(
+        partition=request.args.get('partition'),
+        job_id=request.args.get('job_id', type=int),
+        student_id=request.args.get('student_id', type=int)
+    )
+    return jsonify(applications), 200
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 10000))
+    start_scheduler()
     
     # Use production server for Render
     from waitress import serve
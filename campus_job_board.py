@@ -1,8 +1,140 @@
+import csv
+import io
 import json
 import os
+import re
+import threading
 from enum import Enum
 import datetime
 
+# Deadline patterns, matched after whitespace around separators is removed. Year-last
+# dates can be read month-first or day-first; the separator must be the same throughout.
+DEADLINE_YEAR_FIRST = re.compile(r'(\d{4})([-/.])(\d{1,2})\2(\d{1,2})')
+DEADLINE_YEAR_LAST = re.compile(r'(\d{1,2})([-/.])(\d{1,2})\2(\d{4})')
+DEADLINE_SEPARATOR_SPACES = re.compile(r'\s*([/.-])\s*')
+
+def parse_deadline(value, not_before=None):
+    """Parse a free-form deadline string into a date, or None if it can't be parsed.
+    
+    Values like 10/12/2025 can be read month-first or day-first. Readings earlier than
+    not_before are discarded, and None is returned if more than one reading remains.
+    """
+    if isinstance(value, datetime.date):
+        return value
+    if not isinstance(value, str) or not value.strip():
+        return None
+    
+    cleaned = DEADLINE_SEPARATOR_SPACES.sub(r'\1', value.strip())
+    
+    # Allow a trailing ISO time part, but nothing else after the date
+    date_part, _, time_part = cleaned.replace('T', ' ', 1).partition(' ')
+    if time_part:
+        try:
+            datetime.time.fromisoformat(time_part)
+        except ValueError:
+            return None
+    
+    match = DEADLINE_YEAR_FIRST.fullmatch(date_part)
+    if match:
+        try:
+            return datetime.date(int(match[1]), int(match[3]), int(match[4]))
+        except ValueError:
+            return None
+    
+    match = DEADLINE_YEAR_LAST.fullmatch(date_part)
+    if not match:
+        return None
+    first, second, year = int(match[1]), int(match[3]), int(match[4])
+    candidates = set()
+    for month, day in ((first, second), (second, first)):
+        try:
+            candidates.add(datetime.date(year, month, day))
+        except ValueError:
+            continue
+    if len(candidates) > 1 and not_before is not None:
+        candidates = {date for date in candidates if date >= not_before}
+    return candidates.pop() if len(candidates) == 1 else None
+
+def normalize_deadline(value, not_before=None):
+    """Normalize a deadline to YYYY-MM-DD, or None if it can't be parsed unambiguously"""
+    deadline = parse_deadline(value, not_before)
+    return deadline.isoformat() if deadline else None
+
+def stream_ndjson(rows):
+    """Yield rows as newline-delimited JSON, one line at a time"""
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+# Leading characters that make spreadsheet applications treat a cell as a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def escape_csv_value(value):
+    """Prefix user-supplied strings that a spreadsheet would run as a formula with a quote"""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def stream_csv(rows, fields):
+    """Yield rows as CSV lines with a header, one line at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({field: escape_csv_value(row.get(field)) for field in fields})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+class ImportFormatError(ValueError):
+    """Raised when an import stream can't be decoded or parsed at all"""
+    
+    def __init__(self, line_number, message):
+        super().__init__(f"Line {line_number}: {message}")
+        self.line_number = line_number
+
+def decode_lines(binary_stream):
+    """Decode a binary stream line by line as UTF-8, skipping a leading byte order mark.
+    
+    Decoding per line lets a bad byte be reported with the line it's on.
+    """
+    for line_number, raw in enumerate(binary_stream, start=1):
+        try:
+            yield raw.decode('utf-8-sig' if line_number == 1 else 'utf-8')
+        except UnicodeDecodeError as e:
+            raise ImportFormatError(line_number, 'Input is not valid UTF-8') from e
+
+def iter_import_rows(text_stream, fmt):
+    """Yield (line_number, row) pairs from an NDJSON or CSV text stream or iterable of lines.
+    
+    Rows that aren't JSON objects are yielded as None so callers can report them.
+    Input that can't be decoded, or CSV the csv module rejects, raises ImportFormatError.
+    """
+    line_number = 0
+    reader = None
+    try:
+        if fmt == 'csv':
+            reader = csv.DictReader(text_stream)
+            for row in reader:
+                line_number = reader.line_num
+                yield line_number, row
+            return
+        
+        for line in text_stream:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+    except UnicodeDecodeError as e:
+        raise ImportFormatError(line_number + 1, 'Input is not valid UTF-8') from e
+    except csv.Error as e:
+        raise ImportFormatError((reader.line_num if reader else line_number) + 1, f'Invalid CSV: {e}') from e
+
 class UserRole(Enum):
     STUDENT = "student"
     COMPANY = "company"
@@ -19,16 +151,30 @@ class ApplicationStatus(Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
 
+class JobStatus(Enum):
+    PENDING = "pending"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    CLOSED = "closed"
+
 class JobBoard:
     def __init__(self):
         self.users_file = "users.json"
         self.jobs_file = "jobs.json"
         self.applications_file = "applications.json"
+        self.archive_dir = "archive"
+        self.archive_index_file = os.path.join(self.archive_dir, "index.json")
+        self._lock = threading.RLock()
         
         # Initialize data storage
         self.users = self._load_json(self.users_file, [])
         self.jobs = self._load_json(self.jobs_file, [])
         self.applications = self._load_json(self.applications_file, [])
+        self.archive_index = self._load_json(self.archive_index_file, {
+            'partitions': [],
+            'max_job_id': 0,
+            'max_application_id': 0
+        })
         
         # Initialize with default admin if no users exist
         if not self.users:
@@ -57,7 +203,7 @@ class JobBoard:
     def _save_json(self, filename, data):
         """Save data to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with self._lock, open(filename, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             print(f"💾 Saved {len(data) if isinstance(data, list) else 'data'} items to {filename}")
             return True
@@ -69,9 +215,10 @@ class JobBoard:
         """Save all data to JSON files"""
         print("🔄 Saving all data to JSON files...")
         success = True
-        success &= self._save_json(self.users_file, self.users)
-        success &= self._save_json(self.jobs_file, self.jobs)
-        success &= self._save_json(self.applications_file, self.applications)
+        with self._lock:
+            success &= self._save_json(self.users_file, self.users)
+            success &= self._save_json(self.jobs_file, self.jobs)
+            success &= self._save_json(self.applications_file, self.applications)
         
         if success:
             print("✅ All data saved successfully!")
@@ -132,8 +279,9 @@ class JobBoard:
             print(f"❌ ADD_USER ERROR: Missing required fields in user_data")
             return False
         
-        self.users.append(user_data)
-        success = self._save_json(self.users_file, self.users)
+        with self._lock:
+            self.users.append(user_data)
+            success = self._save_json(self.users_file, self.users)
         
         if success:
             print(f"👤 Added new user: {user_data.get('email', 'Unknown')}")
@@ -151,45 +299,224 @@ class JobBoard:
     
     def add_job(self, job_data):
         """Add a new job and auto-save"""
-        self.jobs.append(job_data)
-        self._save_json(self.jobs_file, self.jobs)
+        if job_data.get('deadline'):
+            job_data['deadline'] = normalize_deadline(job_data['deadline']) or job_data['deadline']
+        with self._lock:
+            self.jobs.append(job_data)
+            self._save_json(self.jobs_file, self.jobs)
         print(f"💼 Added new job: {job_data.get('title', 'Unknown')}")
     
     def add_application(self, app_data):
-        """Add a new application and auto-save"""
-        self.applications.append(app_data)
-        self._save_json(self.applications_file, self.applications)
+        """Add a new application for an open job and auto-save.
+        
+        Returns False if the job was closed or archived in the meantime.
+        """
+        with self._lock:
+            job = next((j for j in self.jobs if j['id'] == app_data.get('job_id')), None)
+            if job is None or not self.is_job_open(job):
+                print(f"❌ Job ID {app_data.get('job_id', 'Unknown')} is no longer open for applications")
+                return False
+            # Allocate the id under the lock so concurrent applications can't share it
+            app_data['id'] = self.get_next_application_id()
+            self.applications.append(app_data)
+            self._save_json(self.applications_file, self.applications)
         print(f"📝 Added new application for job ID: {app_data.get('job_id', 'Unknown')}")
+        return True
+    
+    def is_job_open(self, job, today=None):
+        """Check whether a job is approved and its deadline hasn't passed"""
+        if job.get('status') != JobStatus.APPROVED.value:
+            return False
+        deadline = parse_deadline(job.get('deadline'))
+        return deadline is None or deadline >= (today or datetime.date.today())
+    
+    def iter_applications(self, student_id=None, company_id=None, job_id=None):
+        """Yield applications enriched with job details, without modifying stored records"""
+        jobs = self.jobs
+        applications = self.applications
+        jobs_by_id = {job['id']: job for job in jobs}
+        company_job_ids = None
+        if company_id is not None:
+            company_job_ids = {job['id'] for job in jobs if job['company_id'] == company_id}
+        
+        for app in applications:
+            if student_id is not None and app['student_id'] != student_id:
+                continue
+            if company_job_ids is not None and app['job_id'] not in company_job_ids:
+                continue
+            if job_id is not None and app['job_id'] != job_id:
+                continue
+            enriched = dict(app)
+            enriched['job'] = jobs_by_id.get(app['job_id'])
+            yield enriched
+    
+    def _import_error(self, errors, line_number, message, max_errors):
+        """Record an import error, keeping at most max_errors entries"""
+        if len(errors) < max_errors:
+            errors.append({'line': line_number, 'error': message})
+    
+    def bulk_import_users(self, rows, max_errors=100):
+        """Validate and add users from (line_number, row) pairs, saving once at the end.
+        
+        Returns (imported_count, rejected_count, errors).
+        """
+        roles = {role.value for role in UserRole}
+        emails = {user['email'] for user in self.users}
+        created_at = datetime.datetime.now().isoformat()
+        new_users = []
+        errors = []
+        rejected = 0
+        
+        for line_number, row in rows:
+            if row is None:
+                rejected += 1
+                self._import_error(errors, line_number, 'Malformed row', max_errors)
+                continue
+            email = row.get('email')
+            password = row.get('password')
+            role = row.get('role')
+            if not all(isinstance(value, str) for value in (email, password, role)):
+                rejected += 1
+                self._import_error(errors, line_number, 'email, password and role must be strings', max_errors)
+                continue
+            email = email.strip()
+            if not email or not password or role not in roles:
+                rejected += 1
+                self._import_error(errors, line_number, 'Missing email/password or invalid role', max_errors)
+                continue
+            if email in emails:
+                rejected += 1
+                self._import_error(errors, line_number, f'Duplicate email: {email}', max_errors)
+                continue
+            
+            user = {
+                'id': None,
+                'email': email,
+                'password': password,
+                'role': role,
+                'created_at': created_at
+            }
+            if role == UserRole.STUDENT.value:
+                user['name'] = row.get('name', '')
+                user['college'] = row.get('college', '')
+                user['graduation_year'] = row.get('graduation_year', '')
+            elif role == UserRole.COMPANY.value:
+                user['company_name'] = row.get('company_name', '')
+                user['company_description'] = row.get('company_description', '')
+                user['verified'] = str(row.get('verified', '')).lower() in ('true', '1', 'yes')
+            
+            new_users.append(user)
+            emails.add(email)
+        
+        if new_users:
+            with self._lock:
+                # Allocate the whole id block at once
+                first_id = self.get_next_user_id()
+                for offset, item in enumerate(new_users):
+                    item['id'] = first_id + offset
+                self.users.extend(new_users)
+                self._save_json(self.users_file, self.users)
+        print(f"👥 Bulk imported {len(new_users)} users, rejected {rejected}")
+        return len(new_users), rejected, errors
+    
+    def bulk_import_jobs(self, rows, max_errors=100):
+        """Validate and add jobs from (line_number, row) pairs, saving once at the end.
+        
+        Each row must reference an existing company by company_id. Returns
+        (imported_count, rejected_count, errors).
+        """
+        companies = {user['id']: user for user in self.users
+                     if user['role'] == UserRole.COMPANY.value}
+        statuses = (JobStatus.PENDING.value, JobStatus.APPROVED.value, JobStatus.REJECTED.value)
+        created_at = datetime.datetime.now().isoformat()
+        today = datetime.date.today()
+        new_jobs = []
+        errors = []
+        rejected = 0
+        
+        for line_number, row in rows:
+            if row is None:
+                rejected += 1
+                self._import_error(errors, line_number, 'Malformed row', max_errors)
+                continue
+            try:
+                company = companies.get(int(row.get('company_id')))
+            except (TypeError, ValueError):
+                company = None
+            if company is None or not isinstance(row.get('title'), str) or not row['title'].strip():
+                rejected += 1
+                self._import_error(errors, line_number, 'Missing title or unknown company_id', max_errors)
+                continue
+            deadline = None
+            if row.get('deadline'):
+                deadline = normalize_deadline(row['deadline'], not_before=today)
+                if deadline is None:
+                    rejected += 1
+                    self._import_error(errors, line_number, f"Invalid or ambiguous deadline: {row['deadline']}", max_errors)
+                    continue
+            status = row.get('status') or JobStatus.APPROVED.value
+            if status not in statuses:
+                rejected += 1
+                self._import_error(errors, line_number, f'Invalid status: {status}', max_errors)
+                continue
+            
+            new_jobs.append({
+                'id': None,
+                'company_id': company['id'],
+                'company_name': company.get('company_name', ''),
+                'title': row['title'],
+                'type': row.get('type'),
+                'description': row.get('description'),
+                'requirements': row.get('requirements'),
+                'location': row.get('location'),
+                'deadline': deadline,
+                'status': status,
+                'created_at': created_at
+            })
+        
+        if new_jobs:
+            with self._lock:
+                # Allocate the whole id block at once
+                first_id = self.get_next_job_id()
+                for offset, item in enumerate(new_jobs):
+                    item['id'] = first_id + offset
+                self.jobs.extend(new_jobs)
+                self._save_json(self.jobs_file, self.jobs)
+        print(f"💼 Bulk imported {len(new_jobs)} jobs, rejected {rejected}")
+        return len(new_jobs), rejected, errors
     
     def update_user(self, user_id, updates):
         """Update user data and auto-save"""
-        for user in self.users:
-            if user['id'] == user_id:
-                user.update(updates)
-                self._save_json(self.users_file, self.users)
-                print(f"👤 Updated user: {user.get('email', 'Unknown')}")
-                return True
-        return False
+        with self._lock:
+            for user in self.users:
+                if user['id'] == user_id:
+                    user.update(updates)
+                    self._save_json(self.users_file, self.users)
+                    print(f"👤 Updated user: {user.get('email', 'Unknown')}")
+                    return True
+            return False
     
     def update_job(self, job_id, updates):
         """Update job data and auto-save"""
-        for job in self.jobs:
-            if job['id'] == job_id:
-                job.update(updates)
-                self._save_json(self.jobs_file, self.jobs)
-                print(f"💼 Updated job: {job.get('title', 'Unknown')}")
-                return True
-        return False
+        with self._lock:
+            for job in self.jobs:
+                if job['id'] == job_id:
+                    job.update(updates)
+                    self._save_json(self.jobs_file, self.jobs)
+                    print(f"💼 Updated job: {job.get('title', 'Unknown')}")
+                    return True
+            return False
     
     def update_application(self, app_id, updates):
         """Update application data and auto-save"""
-        for app in self.applications:
-            if app['id'] == app_id:
-                app.update(updates)
-                self._save_json(self.applications_file, self.applications)
-                print(f"📝 Updated application ID: {app_id}")
-                return True
-        return False
+        with self._lock:
+            for app in self.applications:
+                if app['id'] == app_id:
+                    app.update(updates)
+                    self._save_json(self.applications_file, self.applications)
+                    print(f"📝 Updated application ID: {app_id}")
+                    return True
+            return False
     
     def get_next_user_id(self):
         """Get the next available user ID"""
@@ -197,11 +524,13 @@ class JobBoard:
     
     def get_next_job_id(self):
         """Get the next available job ID"""
-        return max([job['id'] for job in self.jobs], default=0) + 1
+        hot_max = max([job['id'] for job in self.jobs], default=0)
+        return max(hot_max, self.archive_index.get('max_job_id', 0)) + 1
     
     def get_next_application_id(self):
         """Get the next available application ID"""
-        return max([app['id'] for app in self.applications], default=0) + 1
+        hot_max = max([app['id'] for app in self.applications], default=0)
+        return max(hot_max, self.archive_index.get('max_application_id', 0)) + 1
     
     def backup_data(self):
         """Create backup files with timestamp"""
@@ -231,19 +560,20 @@ class JobBoard:
         print("🔧 Checking for users without passwords...")
         fixed_count = 0
         
-        for user in self.users:
-            if 'password' not in user or user['password'] is None:
-                print(f"⚠️ Found user without password: {user['email']} (ID: {user['id']})")
-                # Set a temporary password - user will need to reset
-                user['password'] = 'temp123'
-                fixed_count += 1
-                print(f"🔧 Set temporary password for user: {user['email']}")
-        
-        if fixed_count > 0:
-            self._save_json(self.users_file, self.users)
-            print(f"✅ Fixed {fixed_count} users with missing passwords")
-        else:
-            print("✅ All users have passwords")
+        with self._lock:
+            for user in self.users:
+                if 'password' not in user or user['password'] is None:
+                    print(f"⚠️ Found user without password: {user['email']} (ID: {user['id']})")
+                    # Set a temporary password - user will need to reset
+                    user['password'] = 'temp123'
+                    fixed_count += 1
+                    print(f"🔧 Set temporary password for user: {user['email']}")
+            
+            if fixed_count > 0:
+                self._save_json(self.users_file, self.users)
+                print(f"✅ Fixed {fixed_count} users with missing passwords")
+            else:
+                print("✅ All users have passwords")
         
         return fixed_count
     
@@ -254,6 +584,9 @@ class JobBoard:
         # Check users
         users_fixed = self.fix_users_without_passwords()
         
+        # Normalize legacy free-form deadlines
+        self.normalize_job_deadlines()
+        
         # Check for duplicate IDs
         user_ids = [user['id'] for user in self.users]
         if len(user_ids) != len(set(user_ids)):
@@ -269,4 +602,221 @@ class JobBoard:
         
         print("✅ Data integrity validation completed")
         return users_fixed
+    
+    def normalize_job_deadlines(self):
+        """Normalize stored job deadlines to YYYY-MM-DD"""
+        normalized_count = 0
+        
+        with self._lock:
+            for job in self.jobs:
+                raw = job.get('deadline')
+                if not raw:
+                    continue
+                try:
+                    created = datetime.datetime.fromisoformat(job['created_at']).date()
+                except (KeyError, TypeError, ValueError):
+                    created = None
+                normalized = normalize_deadline(raw, not_before=created)
+                if normalized is None:
+                    print(f"⚠️ Unrecognized or ambiguous deadline '{raw}' for job ID {job['id']}, it will never expire")
+                elif normalized != raw:
+                    job['deadline'] = normalized
+                    normalized_count += 1
+            
+            if normalized_count > 0:
+                self._save_json(self.jobs_file, self.jobs)
+                print(f"📅 Normalized {normalized_count} job deadlines")
+        
+        return normalized_count
+    
+    def close_expired_jobs(self, today=None):
+        """Close pending and approved jobs whose deadline has passed"""
+        today = today or datetime.date.today()
+        closed = []
+        
+        with self._lock:
+            for job in self.jobs:
+                if job.get('status') not in (JobStatus.PENDING.value, JobStatus.APPROVED.value):
+                    continue
+                deadline = parse_deadline(job.get('deadline'))
+                if deadline and deadline < today:
+                    job['status'] = JobStatus.CLOSED.value
+                    job['closed_at'] = datetime.datetime.now().isoformat()
+                    closed.append(job)
+            
+            if closed:
+                self._save_json(self.jobs_file, self.jobs)
+                print(f"🔒 Closed {len(closed)} expired jobs")
+        
+        return closed
+    
+    def _archive_partition(self, job):
+        """Get the semester partition (e.g. 2025_fall) a job is archived under"""
+        when = parse_deadline(job.get('deadline'))
+        if when is None:
+            when = datetime.datetime.fromisoformat(job.get('closed_at') or datetime.datetime.now().isoformat()).date()
+        semester = 'spring' if when.month <= 6 else 'fall'
+        return f"{when.year}_{semester}"
+    
+    def _archive_file(self, kind, partition):
+        """Get the archive file path for jobs or applications in a partition"""
+        return os.path.join(self.archive_dir, f"{kind}_{partition}.json")
+    
+    def archive_closed_jobs(self, today=None):
+        """Move closed jobs and their finished applications into the cold archive.
+        
+        A job stays hot while any of its applications is still pending, so companies
+        can finish reviewing them. Rejected jobs are archived once their deadline passes.
+        """
+        today = today or datetime.date.today()
+        
+        with self._lock:
+            pending_job_ids = {app['job_id'] for app in self.applications
+                               if app.get('status') == ApplicationStatus.PENDING.value}
+            
+            archived_jobs = {}
+            for job in self.jobs:
+                if job['id'] in pending_job_ids:
+                    continue
+                status = job.get('status')
+                deadline = parse_deadline(job.get('deadline'))
+                expired_rejection = (status == JobStatus.REJECTED.value
+                                     and deadline is not None and deadline < today)
+                if status == JobStatus.CLOSED.value or expired_rejection:
+                    archived_jobs[job['id']] = job
+            
+            if not archived_jobs:
+                return 0
+            
+            # Group jobs and applications by partition
+            partitions = {}
+            for job in archived_jobs.values():
+                partition = self._archive_partition(job)
+                partitions.setdefault(partition, {'jobs': [], 'applications': []})['jobs'].append(job)
+            for app in self.applications:
+                job = archived_jobs.get(app['job_id'])
+                if job is not None:
+                    partition = self._archive_partition(job)
+                    partitions[partition]['applications'].append(app)
+            
+            # Write every partition to a temp file first and only swap them in once all
+            # writes succeeded, merging by id so a retried run never duplicates records
+            os.makedirs(self.archive_dir, exist_ok=True)
+            pending_writes = []
+            for partition, data in partitions.items():
+                for kind in ('jobs', 'applications'):
+                    if not data[kind]:
+                        continue
+                    filename = self._archive_file(kind, partition)
+                    stored = self._load_json(filename, [])
+                    stored_ids = {record['id'] for record in stored}
+                    stored.extend(record for record in data[kind] if record['id'] not in stored_ids)
+                    temp_filename = filename + ".tmp"
+                    pending_writes.append((temp_filename, filename))
+                    if not self._save_json(temp_filename, stored):
+                        for temp, _ in pending_writes:
+                            if os.path.exists(temp):
+                                os.remove(temp)
+                        print(f"❌ Archiving aborted, hot data left unchanged")
+                        return 0
+            for temp_filename, filename in pending_writes:
+                os.replace(temp_filename, filename)
+            for partition in partitions:
+                if partition not in self.archive_index['partitions']:
+                    self.archive_index['partitions'].append(partition)
+            
+            archived_apps = [app for data in partitions.values() for app in data['applications']]
+            self.archive_index['partitions'].sort()
+            self.archive_index['max_job_id'] = max(
+                [self.archive_index.get('max_job_id', 0)] + list(archived_jobs))
+            self.archive_index['max_application_id'] = max(
+                [self.archive_index.get('max_application_id', 0)] + [app['id'] for app in archived_apps])
+            self._save_json(self.archive_index_file, self.archive_index)
+            
+            # Rebind rather than mutate so readers iterating the old lists are unaffected
+            self.jobs = [job for job in self.jobs if job['id'] not in archived_jobs]
+            self.applications = [app for app in self.applications if app['job_id'] not in archived_jobs]
+            self._save_json(self.jobs_file, self.jobs)
+            self._save_json(self.applications_file, self.applications)
+        
+        print(f"🗄️ Archived {len(archived_jobs)} jobs and {len(archived_apps)} applications")
+        return len(archived_jobs)
+    
+    def get_archive_partitions(self):
+        """List the archived semester partitions"""
+        return list(self.archive_index.get('partitions', []))
+    
+    def iter_archived_jobs(self, partition=None, company_id=None):
+        """Yield archived jobs one partition at a time, optionally filtered by partition and company"""
+        partitions = [partition] if partition else self.get_archive_partitions()
+        for name in partitions:
+            for job in self._load_json(self._archive_file('jobs', name), []):
+                if company_id is None or job.get('company_id') == company_id:
+                    yield job
+    
+    def get_archived_jobs(self, partition=None, company_id=None):
+        """Load archived jobs on demand, optionally filtered by partition and company"""
+        return list(self.iter_archived_jobs(partition, company_id))
+    
+    def iter_archived_applications(self, partition=None, job_id=None, student_id=None, company_id=None):
+        """Yield archived applications one partition at a time, enriched with their archived job.
+        
+        Results can be filtered by partition, job, student and the company that posted the job.
+        """
+        partitions = [partition] if partition else self.get_archive_partitions()
+        for name in partitions:
+            jobs_by_id = {job['id']: job for job in self._load_json(self._archive_file('jobs', name), [])}
+            for app in self._load_json(self._archive_file('applications', name), []):
+                job = jobs_by_id.get(app.get('job_id'))
+                if job_id is not None and app.get('job_id') != job_id:
+                    continue
+                if student_id is not None and app.get('student_id') != student_id:
+                    continue
+                if company_id is not None and (job is None or job.get('company_id') != company_id):
+                    continue
+                app['job'] = job
+                yield app
+    
+    def get_archived_applications(self, partition=None, job_id=None, student_id=None, company_id=None):
+        """Load archived applications on demand, enriched with their archived job"""
+        return list(self.iter_archived_applications(partition, job_id, student_id, company_id))
 
+class DeadlineScheduler:
+    """Background thread that periodically closes expired jobs and archives closed ones"""
+    
+    def __init__(self, job_board, interval=3600):
+        self.job_board = job_board
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def run_once(self):
+        """Close expired jobs and archive closed ones"""
+        try:
+            closed = self.job_board.close_expired_jobs()
+            archived = self.job_board.archive_closed_jobs()
+            return len(closed), archived
+        except Exception as e:
+            print(f"❌ Deadline scheduler run failed: {e}")
+            return 0, 0
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.run_once()
+            self._stop_event.wait(self.interval)
+    
+    def start(self):
+        """Start the scheduler thread if it isn't already running"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="deadline-scheduler", daemon=True)
+        self._thread.start()
+        print(f"⏰ Deadline scheduler started (every {self.interval}s)")
+    
+    def stop(self):
+        """Stop the scheduler thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from campus_job_board import JobBoard
+
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    """A JobBoard whose data and archive files live in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return JobBoard()
@@ -0,0 +1,160 @@
+import io
+import json
+
+import pytest
+
+pytest.importorskip('flask')
+
+
+@pytest.fixture
+def client(board, monkeypatch):
+    import app as app_module
+    monkeypatch.setattr(app_module, 'job_board', board)
+    monkeypatch.setattr(app_module, 'sessions', {})
+    return app_module.app.test_client()
+
+
+def login(client, email, password):
+    response = client.post('/api/login', json={'email': email, 'password': password})
+    return {'Authorization': response.json['session_id']}
+
+
+@pytest.fixture
+def admin(client):
+    return login(client, 'admin@campus.edu', 'admin123')
+
+
+@pytest.fixture
+def company(client):
+    return login(client, 'techcorp@example.com', 'company123')
+
+
+@pytest.fixture
+def student(client):
+    return login(client, 'student@campus.edu', 'student123')
+
+
+def add_job_with_applications(board, job_id=1, status='approved', student_ids=(3,)):
+    board.jobs.append({'id': job_id, 'company_id': 2, 'company_name': 'Tech Corp', 'title': f'Job {job_id}',
+                       'status': status, 'deadline': '2099-12-31', 'created_at': '2025-09-01T00:00:00'})
+    for student_id in student_ids:
+        board.applications.append({'id': len(board.applications) + 1, 'job_id': job_id, 'student_id': student_id,
+                                   'student_name': f'Student {student_id}', 'status': 'approved',
+                                   'cover_letter': '=cmd()', 'applied_at': '2025-09-02T00:00:00'})
+
+
+def test_import_users_from_raw_ndjson_body(client, admin):
+    body = "\n".join(json.dumps(row) for row in (
+        {'email': 'a@x.edu', 'password': 'pw', 'role': 'student'},
+        {'email': 'b@x.edu', 'password': 'pw', 'role': 'unknown'},
+    ))
+
+    response = client.post('/api/admin/import/users?format=ndjson', headers=admin, data=body)
+
+    assert response.status_code == 200
+    assert (response.json['imported'], response.json['rejected']) == (1, 1)
+    assert response.json['errors'][0]['line'] == 2
+
+
+def test_import_jobs_from_raw_csv_body(client, admin, board):
+    body = "company_id,title,deadline\n2,Engineer,2099-01-31\n2,Analyst,not a date\n"
+
+    response = client.post('/api/admin/import/jobs', headers=admin, data=body, content_type='text/csv')
+
+    assert (response.json['imported'], response.json['rejected']) == (1, 1)
+    assert board.jobs[-1]['deadline'] == '2099-01-31'
+
+
+@pytest.mark.parametrize('filename, body', [
+    ('jobs.csv', "company_id,title\n2,Engineer\n"),
+    ('jobs.ndjson', json.dumps({'company_id': 2, 'title': 'Engineer'}) + "\n"),
+])
+def test_import_jobs_from_upload_infers_format(client, admin, filename, body):
+    data = {'file': (io.BytesIO(body.encode('utf-8')), filename)}
+
+    response = client.post('/api/admin/import/jobs', headers=admin, data=data, content_type='multipart/form-data')
+
+    assert (response.json['imported'], response.json['rejected']) == (1, 0)
+
+
+def test_import_upload_with_unknown_format_is_rejected(client, admin):
+    data = {'file': (io.BytesIO(b"company_id,title\n2,Engineer\n"), 'jobs.txt', 'text/plain')}
+
+    response = client.post('/api/admin/import/jobs', headers=admin, data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 400
+
+
+def test_import_invalid_utf8_is_rejected_with_line(client, admin, board):
+    body = b'{"email": "a@x.edu", "password": "pw", "role": "student"}\n\xff\xfe\n'
+
+    response = client.post('/api/admin/import/users?format=ndjson', headers=admin, data=body)
+
+    assert response.status_code == 400
+    assert response.json['line'] == 2
+    assert len(board.users) == 3
+
+
+def test_company_cannot_import(client, company):
+    response = client.post('/api/admin/import/jobs?format=ndjson', headers=company, data=b'')
+
+    assert response.status_code == 403
+
+
+def test_student_export_only_contains_own_applications(client, student, board):
+    add_job_with_applications(board, student_ids=(3, 99))
+
+    response = client.get('/api/applications/export?format=ndjson', headers=student)
+
+    rows = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [row['student_id'] for row in rows] == [3]
+    assert rows[0]['job']['title'] == 'Job 1'
+
+
+def test_company_export_streams_csv_including_archived(client, company, board):
+    add_job_with_applications(board, job_id=1)
+    add_job_with_applications(board, job_id=2, status='closed')
+    board.archive_closed_jobs()
+
+    response = client.get('/api/applications/export?format=csv', headers=company)
+    assert response.is_streamed
+    assert response.mimetype == 'text/csv'
+    lines = response.data.decode().splitlines()
+    assert lines[0].startswith('id,job_id,job_title')
+    assert len(lines) == 2
+    assert lines[1].endswith(",'=cmd()")
+
+    response = client.get('/api/applications/export?format=csv&job_id=2&include_archived=1', headers=company)
+    lines = response.data.decode().splitlines()
+    assert len(lines) == 2
+    assert ',2,Job 2,' in lines[1]
+
+
+def test_import_100k_users_through_endpoint(client, admin, board, tmp_path):
+    row_count = 100_000
+    path = tmp_path / "users_import.ndjson"
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(row_count):
+            f.write(json.dumps({'email': f'student{i}@campus.edu', 'password': 'pw', 'role': 'student'}) + "\n")
+    first_id = board.get_next_user_id()
+
+    with open(path, 'rb') as f:
+        data = {'file': (f, 'users_import.ndjson')}
+        response = client.post('/api/admin/import/users', headers=admin, data=data,
+                               content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert (response.json['imported'], response.json['rejected']) == (row_count, 0)
+    assert board.users[-1]['id'] == first_id + row_count - 1
+
+
+def test_export_100k_applications_through_endpoint(client, admin, board):
+    row_count = 100_000
+    add_job_with_applications(board, student_ids=range(row_count))
+
+    response = client.get('/api/applications/export?format=csv', headers=admin)
+
+    assert response.is_streamed
+    lines = response.data.decode().splitlines()
+    assert len(lines) == row_count + 1
+    assert lines[0] == 'id,job_id,job_title,company_name,student_id,student_name,status,applied_at,cover_letter'
@@ -0,0 +1,71 @@
+import json
+import os
+
+
+def add_closed_job(board, job_id, app_id):
+    board.jobs.append({'id': job_id, 'company_id': 2, 'company_name': 'Tech Corp', 'title': 'Closed',
+                       'status': 'closed', 'deadline': '2025-10-01', 'created_at': '2025-09-01T00:00:00'})
+    board.applications.append({'id': app_id, 'job_id': job_id, 'student_id': 3, 'status': 'approved'})
+
+
+def test_archive_moves_closed_jobs_and_applications(board):
+    add_closed_job(board, 1, 1)
+
+    assert board.archive_closed_jobs() == 1
+
+    assert board.jobs == [] and board.applications == []
+    assert [job['id'] for job in board.get_archived_jobs(company_id=2)] == [1]
+    assert [app['id'] for app in board.get_archived_applications(student_id=3)] == [1]
+    assert board.get_archive_partitions() == ['2025_fall']
+    assert board.get_next_job_id() == 2
+
+
+def test_failed_archive_write_leaves_no_partial_partition(board, monkeypatch):
+    add_closed_job(board, 1, 1)
+    real_save = board._save_json
+
+    def failing_save(filename, data):
+        if 'applications_' in filename:
+            return False
+        return real_save(filename, data)
+
+    monkeypatch.setattr(board, '_save_json', failing_save)
+    assert board.archive_closed_jobs() == 0
+    assert not os.path.exists(board._archive_file('jobs', '2025_fall'))
+    assert not [name for name in os.listdir(board.archive_dir) if name.endswith('.tmp')]
+    assert [job['id'] for job in board.jobs] == [1]
+
+    monkeypatch.setattr(board, '_save_json', real_save)
+    assert board.archive_closed_jobs() == 1
+    assert len(board.get_archived_jobs()) == 1
+
+
+def test_archive_merge_skips_records_already_archived(board):
+    add_closed_job(board, 1, 1)
+    os.makedirs(board.archive_dir)
+    with open(board._archive_file('jobs', '2025_fall'), 'w') as f:
+        json.dump([dict(board.jobs[0])], f)
+
+    board.archive_closed_jobs()
+
+    assert len(board.get_archived_jobs(partition='2025_fall')) == 1
+
+
+def test_archived_applications_scoped_to_company_include_job(board):
+    add_closed_job(board, 1, 1)
+    board.archive_closed_jobs()
+
+    applications = board.get_archived_applications(company_id=2)
+    assert [app['id'] for app in applications] == [1]
+    assert applications[0]['job']['title'] == 'Closed'
+    assert board.get_archived_applications(company_id=99) == []
+
+
+def test_add_application_rejects_expired_or_archived_job(board):
+    board.jobs.append({'id': 1, 'company_id': 2, 'title': 'Open', 'status': 'approved', 'deadline': '2099-01-01'})
+    board.jobs.append({'id': 2, 'company_id': 2, 'title': 'Expired', 'status': 'approved', 'deadline': '2020-01-01'})
+
+    assert board.add_application({'job_id': 1, 'student_id': 3, 'status': 'pending'})
+    assert not board.add_application({'job_id': 2, 'student_id': 3, 'status': 'pending'})
+    assert not board.add_application({'job_id': 99, 'student_id': 3, 'status': 'pending'})
+    assert [app['job_id'] for app in board.applications] == [1]
@@ -0,0 +1,136 @@
+import io
+import json
+
+import pytest
+
+from campus_job_board import ImportFormatError, decode_lines, iter_import_rows, stream_csv, stream_ndjson
+
+
+def ndjson_rows(*rows):
+    return iter_import_rows(io.StringIO("".join(json.dumps(row) + "\n" for row in rows)), 'ndjson')
+
+
+def test_user_rows_with_wrong_types_are_rejected(board):
+    rows = ndjson_rows(
+        {'email': 123, 'password': 'pw', 'role': 'student'},
+        {'email': 'a@x.edu', 'password': 'pw', 'role': []},
+        {'email': 'b@x.edu', 'password': None, 'role': 'student'},
+        {'email': 'c@x.edu', 'password': 'pw', 'role': 'student'},
+    )
+
+    imported, rejected, errors = board.bulk_import_users(rows)
+
+    assert (imported, rejected) == (1, 3)
+    assert [error['line'] for error in errors] == [1, 2, 3]
+
+
+def test_job_rows_with_non_string_title_are_rejected(board):
+    rows = ndjson_rows(
+        {'company_id': 2, 'title': ['Engineer']},
+        {'company_id': 2, 'title': '   '},
+        {'company_id': 2, 'title': 'Engineer'},
+    )
+
+    imported, rejected, errors = board.bulk_import_jobs(rows)
+
+    assert (imported, rejected) == (1, 2)
+    assert board.jobs[-1]['title'] == 'Engineer'
+
+
+ROW_COUNT = 100_000
+BAD_EVERY = 10_000
+
+
+def count_saves(board, monkeypatch):
+    saves = {}
+    real_save = board._save_json
+
+    def counting_save(filename, data):
+        saves[filename] = saves.get(filename, 0) + 1
+        return real_save(filename, data)
+
+    monkeypatch.setattr(board, '_save_json', counting_save)
+    return saves
+
+
+def test_bulk_import_100k_users_from_csv(board, tmp_path, monkeypatch):
+    path = tmp_path / "users_import.csv"
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write("email,password,role,name\n")
+        for i in range(ROW_COUNT):
+            # Every BAD_EVERY-th row has no password
+            password = '' if i % BAD_EVERY == 0 else 'pw'
+            f.write(f"student{i}@campus.edu,{password},student,Student {i}\n")
+    first_id = board.get_next_user_id()
+    saves = count_saves(board, monkeypatch)
+
+    with open(path, encoding='utf-8', newline='') as f:
+        imported, rejected, errors = board.bulk_import_users(iter_import_rows(f, 'csv'))
+
+    expected_rejected = ROW_COUNT // BAD_EVERY
+    assert (imported, rejected) == (ROW_COUNT - expected_rejected, expected_rejected)
+    assert len(errors) == expected_rejected
+    new_ids = [user['id'] for user in board.users[-imported:]]
+    assert new_ids == list(range(first_id, first_id + imported))
+    assert saves == {board.users_file: 1}
+
+
+def test_bulk_import_100k_jobs_from_ndjson(board, tmp_path, monkeypatch):
+    path = tmp_path / "jobs_import.ndjson"
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(ROW_COUNT):
+            if i % BAD_EVERY == 0:
+                f.write("{not json\n")
+            else:
+                f.write(json.dumps({'company_id': 2, 'title': f'Job {i}', 'deadline': '2099 / 12 / 31'}) + "\n")
+    first_id = board.get_next_job_id()
+    saves = count_saves(board, monkeypatch)
+
+    with open(path, encoding='utf-8') as f:
+        imported, rejected, errors = board.bulk_import_jobs(iter_import_rows(f, 'ndjson'))
+
+    expected_rejected = ROW_COUNT // BAD_EVERY
+    assert (imported, rejected) == (ROW_COUNT - expected_rejected, expected_rejected)
+    assert errors[0] == {'line': 1, 'error': 'Malformed row'}
+    assert [job['id'] for job in board.jobs] == list(range(first_id, first_id + imported))
+    assert board.jobs[-1]['deadline'] == '2099-12-31'
+    assert saves == {board.jobs_file: 1}
+
+
+def test_stream_100k_rows():
+    rows = ({'id': i, 'title': f'Job, "{i}"'} for i in range(ROW_COUNT))
+    csv_lines = "".join(stream_csv(rows, ['id', 'title'])).splitlines()
+    assert len(csv_lines) == ROW_COUNT + 1
+    assert csv_lines[0] == 'id,title'
+    assert csv_lines[1] == '0,"Job, ""0"""'
+
+    rows = ({'id': i} for i in range(ROW_COUNT))
+    chunks = list(stream_ndjson(rows))
+    assert len(chunks) == ROW_COUNT
+    assert json.loads(chunks[-1]) == {'id': ROW_COUNT - 1}
+
+
+def test_undecodable_input_raises_import_format_error(board):
+    lines = decode_lines(io.BytesIO(b'{"email": "a@x.edu"}\n\xff\xfe\n'))
+
+    with pytest.raises(ImportFormatError) as excinfo:
+        board.bulk_import_users(iter_import_rows(lines, 'ndjson'))
+
+    assert excinfo.value.line_number == 2
+
+
+def test_oversized_csv_field_raises_import_format_error(board):
+    text_stream = io.StringIO("email,password,role\n" + "x" * 200_000 + ",pw,student\n", newline='')
+
+    with pytest.raises(ImportFormatError) as excinfo:
+        board.bulk_import_users(iter_import_rows(text_stream, 'csv'))
+    assert excinfo.value.line_number == 2
+    assert len(board.users) == 3
+
+
+def test_stream_csv_escapes_formulas():
+    rows = [{'name': '=HYPERLINK("http://evil")', 'note': '@SUM(A1)', 'id': -1, 'plain': 'ok'}]
+
+    lines = "".join(stream_csv(rows, ['name', 'note', 'id', 'plain'])).splitlines()
+
+    assert lines[1] == '"\'=HYPERLINK(""http://evil"")",\'@SUM(A1),-1,ok'
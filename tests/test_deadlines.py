@@ -0,0 +1,61 @@
+import datetime
+import json
+
+from campus_job_board import JobBoard, normalize_deadline, parse_deadline
+
+
+def test_normalize_deadline_formats():
+    assert normalize_deadline("2025 / 12 / 30") == "2025-12-30"
+    assert normalize_deadline("12/25/2025") == "2025-12-25"
+    assert normalize_deadline("25/12/2025") == "2025-12-25"
+    assert normalize_deadline("2025-01-02T10:00:00") == "2025-01-02"
+    assert normalize_deadline("2025-01-02 10:00:00.123+05:30") == "2025-01-02"
+    assert normalize_deadline("next friday") is None
+    assert normalize_deadline("") is None
+
+
+def test_trailing_garbage_and_compact_forms_are_rejected():
+    assert parse_deadline("2025-12-3099") is None
+    assert parse_deadline("2025-12-30 garbage") is None
+    assert parse_deadline("20251230") is None
+    assert parse_deadline("2025-W01-1") is None
+    assert parse_deadline("2025/12-30") is None
+    assert parse_deadline("2025-02-30") is None
+
+
+def test_year_last_separators_are_equivalent():
+    assert normalize_deadline("12-25-2025") == "2025-12-25"
+    assert normalize_deadline("12.25.2025") == "2025-12-25"
+    assert normalize_deadline("25.12.2025") == "2025-12-25"
+
+
+def test_ambiguous_deadline_is_not_guessed():
+    assert parse_deadline("10/12/2025") is None
+    assert parse_deadline("10.12.2025") is None
+    assert parse_deadline("10-12-2025") is None
+    assert parse_deadline("10/10/2025") == datetime.date(2025, 10, 10)
+
+
+def test_ambiguous_deadline_resolved_by_not_before():
+    assert parse_deadline("10/12/2025", not_before=datetime.date(2025, 11, 2)) == datetime.date(2025, 12, 10)
+    assert parse_deadline("10/12/2025", not_before=datetime.date(2025, 1, 1)) is None
+
+
+def test_startup_normalization_uses_created_at(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    jobs = [
+        {'id': 1, 'company_id': 2, 'title': 'A', 'status': 'approved',
+         'deadline': '10/12/2025', 'created_at': '2025-11-02T14:26:53'},
+        {'id': 2, 'company_id': 2, 'title': 'B', 'status': 'approved',
+         'deadline': '03/04/2026', 'created_at': '2025-11-02T14:26:53'},
+    ]
+    users = [{'id': 1, 'email': 'admin@campus.edu', 'password': 'admin123', 'role': 'admin'}]
+    (tmp_path / "users.json").write_text(json.dumps(users))
+    (tmp_path / "jobs.json").write_text(json.dumps(jobs))
+
+    board = JobBoard()
+
+    assert board.jobs[0]['deadline'] == '2025-12-10'
+    # Both readings are after created_at, so the raw value is kept untouched
+    assert board.jobs[1]['deadline'] == '03/04/2026'
+    assert board.close_expired_jobs(today=datetime.date(2027, 1, 1)) == [board.jobs[0]]